@@ -3,6 +3,12 @@
 # Fire Risk Analysis Dashboard
 # -----------------------------------------------------------
 
+import hashlib
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
 import duckdb
@@ -15,13 +21,63 @@ st.set_page_config(
     layout="wide"
 )
 
+# Streamlit renders charts without the default Altair theme's fixed 300px view, so the specs from
+# build_bar_spec must too. Set once for the process: toggling this global per build would race
+alt.theme.enable('none')
+
 # --- DATABASE CONNECTION ---
-@st.cache_data  # This caches the data so it runs fast
-def load_data(query):
-    """Connects to DuckDB, executes a query, and returns a Pandas DataFrame."""
-    with duckdb.connect('dwelling_fires.duckdb') as con:
-        df = con.execute(query).df()
-    return df
+DB_PATH = 'dwelling_fires.duckdb'
+
+def get_db_version():
+    """Returns (DB file mtime, digest of the query code), the key every cache below is built on.
+
+    The persisted caches only key on a function's own source, so edits to QUERIES or the
+    helpers that shape their results must change this key to invalidate them.
+    """
+    code = hashlib.sha256()
+    for key, query in QUERIES.items():
+        code.update(f"{key}\n{query}\n".encode())
+    for helper in (fetch_df, top_k):
+        code.update(inspect.getsource(helper).encode())
+    return os.path.getmtime(DB_PATH), code.hexdigest()
+
+@st.cache_resource  # One holder per process, so DuckDB keeps its buffer pool warm between reruns
+def get_db_state():
+    """Holds the shared connection, its prepared cursors and the DB version they were opened for."""
+    # The lock lives here, not at module level, because Streamlit re-executes app.py on every rerun
+    return {'lock': threading.Lock(), 'version': None, 'con': None, 'cursors': {}}
+
+def get_cursors(state, db_version):
+    """Returns one cursor per dashboard query in QUERIES, reconnecting if db_version changed.
+
+    Call with state['lock'] held.
+    """
+    if state['version'] == db_version:
+        return state['cursors']
+
+    # DuckDB reuses the open database instance for a path while any handle on it is alive, so
+    # every old cursor and the connection must be closed first or the new connection reads the old file
+    for cur in state['cursors'].values():
+        cur.close()
+    if state['con'] is not None:
+        state['con'].close()
+    state.update(version=None, con=None, cursors={})
+
+    con = duckdb.connect(DB_PATH, read_only=True)
+    cursors = {}
+    for key, query in QUERIES.items():
+        # Prepared statements belong to a cursor; parse and plan each query once per connection,
+        # fetch_df() only EXECUTEs it
+        cur = con.cursor()
+        cur.execute(f"PREPARE {key} AS {query}")
+        cursors[key] = cur
+    state.update(version=db_version, con=con, cursors=cursors)
+    return cursors
+
+def fetch_df(con, key):
+    """Executes a prepared query and wraps its Arrow result in a DataFrame without copying the columns."""
+    # execute(), not sql(): the relation API materialises EXECUTE's result and re-scans it
+    return con.execute(f"EXECUTE {key}").to_arrow_table().to_pandas(types_mapper=pd.ArrowDtype)
 
 # --- SQL QUERIES ---
 
@@ -46,25 +102,52 @@ ORDER BY
     avg_vehicles DESC
 """
 
-# Query 1b: Fire Start Locations
+# Query 1b: Fire Start Locations (House vs. Flats, % of each building group)
 sql_locations = """
-SELECT 
-    d.dwelling_type,
-    dl.fire_start_location,
-    COUNT(f.fact_dwelling_fire_id) AS number_of_incidents
+WITH base AS (
+    SELECT 
+        CASE
+            WHEN d.dwelling_type = 'House - single occupancy' THEN 'House'
+            WHEN d.dwelling_type LIKE 'Purpose Built%' THEN 'Purpose Built Flats'
+            ELSE 'Other'
+        END AS building_group,
+        CASE
+            WHEN dl.fire_start_location = 'Kitchen' THEN 'Kitchen'
+            WHEN dl.fire_start_location IN ('Living Room', 'Bedroom/ Bedsitting Room') THEN 'Living/Bedroom'
+            WHEN dl.fire_start_location IN ('Refuse Store', 'Corridor/ Hall/ Open Plan Area/ Reception Area', 'Stairs/ Under stairs (enclosed area)') THEN 'Communal/Escape Routes'
+            ELSE 'Other Room/External'
+        END AS location_group
+    FROM 
+        fact_dwelling_fire f
+    JOIN 
+        dim_dwelling d ON f.dwelling_key = d.dwelling_key
+    JOIN 
+        dim_location dl ON f.location_key = dl.location_key
+    WHERE 
+        dl.fire_start_location IS NOT NULL
+        AND dl.fire_start_location != 'Not known'
+        AND d.dwelling_type IS NOT NULL
+),
+grouped AS (
+    SELECT 
+        building_group,
+        location_group,
+        COUNT(*) AS number_of_incidents,
+        -- Percentage of ALL incidents in the building group (incl. 'Other Room/External')
+        ROUND(100 * COUNT(*)::DOUBLE / SUM(COUNT(*)) OVER (PARTITION BY building_group), 1) AS percentage
+    FROM 
+        base
+    WHERE 
+        building_group IN ('House', 'Purpose Built Flats')
+    GROUP BY 
+        building_group,
+        location_group
+)
+SELECT * 
 FROM 
-    fact_dwelling_fire f
-JOIN 
-    dim_dwelling d ON f.dwelling_key = d.dwelling_key
-JOIN 
-    dim_location dl ON f.location_key = dl.location_key
+    grouped
 WHERE 
-    dl.fire_start_location IS NOT NULL
-    AND dl.fire_start_location != 'Not known'
-    AND d.dwelling_type IS NOT NULL
-GROUP BY 
-    d.dwelling_type,
-    dl.fire_start_location
+    location_group != 'Other Room/External'
 """
 
 # Query 2: The Human Cost & Destruction Analysis
@@ -73,7 +156,7 @@ SELECT
     di.cause_of_fire,
     COUNT(f.fact_dwelling_fire_id) AS number_of_incidents,
     ROUND(AVG(ds.spread_rank), 2) AS avg_spread_rank,
-    SUM(f.fatality_casualty_flag) AS total_incidents_with_casualties,
+    SUM(f.fatality_casualty_flag)::BIGINT AS total_incidents_with_casualties,
     ROUND(AVG(f.fatality_casualty_flag) * 100, 2) AS pct_chance_of_casualty,
     ROUND(AVG(f.rescues), 2) AS avg_rescues_per_incident
 FROM 
@@ -93,6 +176,32 @@ HAVING
     COUNT(f.fact_dwelling_fire_id) > 100 -- Filter out noise
 """
 
+# Query 2a: Human cost ranked three ways in one scan (split into the Top-K slices in load_all)
+sql_human_cost_ranked = f"""
+WITH agg AS ({sql_human_cost})
+SELECT * 
+FROM (
+    SELECT 
+        *,
+        ROW_NUMBER() OVER (ORDER BY pct_chance_of_casualty DESC) AS r_cas,
+        ROW_NUMBER() OVER (ORDER BY avg_spread_rank DESC) AS r_spr,
+        ROW_NUMBER() OVER (ORDER BY avg_rescues_per_incident DESC) AS r_res
+    FROM 
+        agg
+)
+WHERE 
+    r_cas <= 10 
+    OR r_spr <= 5 
+    OR r_res <= 5
+"""
+
+# Queries run by the dashboard, each prepared on its own cursor (see get_cursors)
+QUERIES = {
+    'vehicles': sql_vehicles,
+    'locations': sql_locations,
+    'human_cost_ranked': sql_human_cost_ranked,
+}
+
 # Query 3: The SQL code itself (for display in Tab 4)
 sql_to_display = """
 -- Final 'Human Cost & Complexity' query
@@ -118,51 +227,50 @@ HAVING
     COUNT(f.fact_dwelling_fire_id) > 100
 """
 
+# --- DATA LOADING ---
+def top_k(df_ranked, rank_col, k, value_col):
+    """Takes the top k rows by a pre-computed rank column, keeping only the charted columns."""
+    return (
+        df_ranked[df_ranked[rank_col] <= k]
+        .sort_values(rank_col)[['cause_of_fire', value_col, 'number_of_incidents']]
+        .reset_index(drop=True)
+    )
+
+@st.cache_data(persist="disk")  # Cached on disk so restarts don't re-run the queries
+def load_all(db_version):
+    """Runs every dashboard query concurrently and returns the DataFrames as a tuple."""
+    state = get_db_state()
+    # Held while querying, so a DB version change can't close these cursors mid-query
+    with state['lock']:
+        cursors = get_cursors(state, db_version)
+        # Each query runs on its own cursor, so the threads never share a DuckDB handle
+        with ThreadPoolExecutor(max_workers=len(QUERIES)) as executor:
+            futures = {key: executor.submit(fetch_df, cursors[key], key) for key in QUERIES}
+        df_vehicles = futures['vehicles'].result()
+        df_locations = futures['locations'].result()
+        df_human_cost_ranked = futures['human_cost_ranked'].result()
+
+    df_casualty_risk = top_k(df_human_cost_ranked, 'r_cas', 10, 'pct_chance_of_casualty')
+    df_spread_risk = top_k(df_human_cost_ranked, 'r_spr', 5, 'avg_spread_rank')
+    df_rescue_risk = top_k(df_human_cost_ranked, 'r_res', 5, 'avg_rescues_per_incident')
+    return df_vehicles, df_locations, df_casualty_risk, df_spread_risk, df_rescue_risk
+
+@st.cache_resource(max_entries=1)  # Shares the same DataFrame objects across reruns and sessions (no per-call copy)
+def get_frames(db_version):
+    """Returns the load_all() frames; callers must treat them as read-only."""
+    return load_all(db_version)
+
 # --- PANDAS PROCESSING for 'House vs. Flats' Chart ---
-@st.cache_data
-def process_location_data():
-    df_locations_raw = load_data(sql_locations)
-    
-    def group_buildings(dwelling_type):
-        if dwelling_type == 'House - single occupancy':
-            return 'House'
-        if dwelling_type.startswith('Purpose Built'):
-            return 'Purpose Built Flats'
-        return 'Other'
-
-    def group_locations(location):
-        if location == 'Kitchen':
-            return 'Kitchen'
-        if location in ('Living Room', 'Bedroom/ Bedsitting Room'):
-            return 'Living/Bedroom'
-        if location in ('Refuse Store', 'Corridor/ Hall/ Open Plan Area/ Reception Area', 'Stairs/ Under stairs (enclosed area)'):
-            return 'Communal/Escape Routes'
-        return 'Other Room/External'
-
-    df_locations_raw['building_group'] = df_locations_raw['dwelling_type'].apply(group_buildings)
-    df_locations_raw['location_group'] = df_locations_raw['fire_start_location'].apply(group_locations)
-
-    df_groups = df_locations_raw[
-        df_locations_raw['building_group'].isin(['House', 'Purpose Built Flats'])
-    ].copy() 
-
-    df_grouped_counts = df_groups.groupby(
-        ['building_group', 'location_group']
-    )['number_of_incidents'].sum().reset_index()
-
-    group_totals = df_grouped_counts.groupby('building_group')['number_of_incidents'].sum()
-    df_grouped_counts['group_total'] = df_grouped_counts['building_group'].map(group_totals)
-    df_grouped_counts['percentage'] = (
-        100 * df_grouped_counts['number_of_incidents'] / df_grouped_counts['group_total']
-    ).round(1)
+@st.cache_resource(max_entries=1)  # Only the current DB version's frames stay alive
+def process_location_data(db_version):
+    # Grouping and percentages are done in DuckDB (see sql_locations); only reshape here
+    _, df_grouped_counts, _, _, _ = get_frames(db_version)
 
     df_locations_pivot_pct = df_grouped_counts.pivot(
         index='location_group', 
         columns='building_group', 
         values='percentage'
     ).fillna(0)
-
-    df_locations_pivot_pct = df_locations_pivot_pct.drop('Other Room/External', errors='ignore')
     
     # Un-pivot the data for Altair
     df_locations_chart_data = df_locations_pivot_pct.reset_index().melt(
@@ -173,6 +281,65 @@ def process_location_data():
     
     return df_locations_chart_data, df_locations_pivot_pct
 
+@st.cache_resource(max_entries=1)  # Built once, so reruns skip the DataFrame -> records conversion
+def get_chart_records(db_version):
+    """Returns the JSON-ready record lists (list of dicts) each chart is drawn from."""
+    df_vehicles, _, df_casualty_risk, df_spread_risk, df_rescue_risk = get_frames(db_version)
+    df_locations_chart_data, _ = process_location_data(db_version)
+    return {
+        'vehicles_top5': df_vehicles.head(5).to_dict(orient='records'),
+        'locations': df_locations_chart_data.to_dict(orient='records'),
+        'casualty_risk': df_casualty_risk.to_dict(orient='records'),
+        'spread_risk': df_spread_risk.to_dict(orient='records'),
+        'rescue_risk': df_rescue_risk.to_dict(orient='records'),
+    }
+
+# --- CHART SPECS ---
+# Reruns reuse the finished Vega-Lite dict instead of rebuilding it with Altair
+# (alt.Undefined, the "not set" default for `sort`, needs an explicit hash function)
+@st.cache_data(hash_funcs={type(alt.Undefined): repr})
+def build_bar_spec(data_records, x, y, x_title, y_title, tooltip, label_fmt,
+                   sort=alt.Undefined, color=None, group=None, group_title=None, height=None,
+                   bar_width=None, label_above=True):
+    """Builds a labelled bar chart (angled x-axis, value label on each bar) as a Vega-Lite spec.
+
+    Pass `color` for a fixed bar colour, or `group` to colour and dodge the bars by a field.
+    `label_above=False` centres the label on the bar's top edge instead of just above it.
+    """
+    # Records carry no dtypes, so declare them: category fields are nominal, the rest quantitative
+    def typed(field):
+        return f"{field}:N" if field in (x, group) else f"{field}:Q"
+
+    encoding = dict(
+        x=alt.X(typed(x), sort=sort, title=x_title, axis=alt.Axis(labelAngle=-45)),  # Angled labels
+        y=alt.Y(typed(y), title=y_title),
+        tooltip=[typed(field) for field in tooltip],
+    )
+    if group is not None:
+        # xOffset "dodges" the bars side-by-side
+        encoding.update(color=alt.Color(typed(group), title=group_title), xOffset=alt.XOffset(typed(group)))
+    elif color is not None:
+        encoding.update(color=alt.value(color))
+
+    base = alt.Chart(alt.Data(values=data_records)).encode(**encoding)
+
+    bars = base.mark_bar() if bar_width is None else base.mark_bar(width=bar_width)
+
+    text_marks = dict(baseline='bottom', dy=-5) if label_above else {}
+    text = base.mark_text(
+        align='center',
+        **text_marks
+    ).encode(
+        text=alt.Text(typed(y), format=label_fmt),
+        color=alt.value('black')
+    )
+
+    chart = bars + text
+    if height is not None:
+        chart = chart.properties(height=height)
+
+    return chart.interactive().to_dict()
+
 # ---------------- SIDEBAR NAVIGATION ----------------
 st.sidebar.title("🚒 Fire Risk Dashboard")
 page = st.sidebar.radio(
@@ -214,9 +381,10 @@ if page == "Overview":
     """)
 
     # --- Load Data ---
-    df_vehicles = load_data(sql_vehicles)
-    df_locations_chart_data, df_locations_pivot_pct = process_location_data()
-    df_vehicles_top5 = df_vehicles.head(5)
+    db_version = get_db_version()  # Once per rerun, so every frame below comes from the same version
+    df_vehicles, _, _, _, _ = get_frames(db_version)
+    _, df_locations_pivot_pct = process_location_data(db_version)
+    chart_records = get_chart_records(db_version)
 
     col1, col2 = st.columns(2)
 
@@ -230,31 +398,17 @@ if page == "Overview":
             This dramatically increases for medium and high-rise flats, proving the service pre-plans for the added complexity and risk of taller buildings.
             """)
         
-        # --- Chart 1: Altair Vertical Column Chart (Labels Fixed & Added) ---
-        base = alt.Chart(df_vehicles_top5).encode(
-            x=alt.X("dwelling_type", 
-                    sort=None, 
-                    title="Dwelling Type",
-                    axis=alt.Axis(labelAngle=-45)), # Angled labels
-            y=alt.Y("avg_vehicles", 
-                    title="Average Vehicles per Incident"),
-            tooltip=["dwelling_type", "number_of_incidents", "avg_vehicles"]
-        )
-        
-        bars = base.mark_bar()
-        
-        text = base.mark_text(
-            align='center',
-            baseline='bottom',
-            dy=-5  
-        ).encode(
-            text=alt.Text("avg_vehicles", format=".2f"),
-            color=alt.value("black")
+        # --- Chart 1: Vertical Column Chart (Labels Fixed & Added) ---
+        spec1 = build_bar_spec(
+            chart_records['vehicles_top5'],
+            x="dwelling_type", y="avg_vehicles",
+            x_title="Dwelling Type", y_title="Average Vehicles per Incident",
+            tooltip=["dwelling_type", "number_of_incidents", "avg_vehicles"],
+            label_fmt=".2f",
+            sort=None  # Keep the query's avg_vehicles DESC order
         )
 
-        chart1 = (bars + text).interactive()
-        
-        st.altair_chart(chart1, use_container_width=True)
+        st.vega_lite_chart(spec1, use_container_width=True)
         
         with st.expander("View Full Data Table (All Dwelling Types)"):
             st.dataframe(df_vehicles)
@@ -272,41 +426,17 @@ if page == "Overview":
             """)
 
         # --- Chart 2: **FIXED** True Clustered Column Chart (using xOffset) ---
-        
-        # 1. Base chart definition
-        base = alt.Chart(df_locations_chart_data).encode(
-            # X-axis is the location group
-            x=alt.X('location_group', title='Fire Start Location', axis=alt.Axis(labelAngle=-45)),
-            
-            # Y-axis is the percentage
-            y=alt.Y('percentage', title='Percentage of Incidents'),
-            
-            # Color is by building group
-            color=alt.Color('building_group', title='Building Group'),
-            
-            # This is the key: it "dodges" the bars side-by-side
-            xOffset=alt.XOffset('building_group'),
-            
-            tooltip=['location_group', 'building_group', 'percentage']
-        )
-        
-        # 2. Bars - using a fixed width for spacing
-        bars = base.mark_bar(width=30)
-        
-        # 3. Text labels
-        text = base.mark_text(
-            align='center',
-            baseline='bottom',
-            dy=-5
-        ).encode(
-            text=alt.Text('percentage', format=".1f"),
-            color=alt.value('black')
+        spec2 = build_bar_spec(
+            chart_records['locations'],
+            x='location_group', y='percentage',
+            x_title='Fire Start Location', y_title='Percentage of Incidents',
+            tooltip=['location_group', 'building_group', 'percentage'],
+            label_fmt=".1f",
+            group='building_group', group_title='Building Group',
+            bar_width=30  # Fixed width for spacing
         )
-        
-        # 4. Layer and make interactive
-        chart2 = (bars + text).interactive()
-        
-        st.altair_chart(chart2, use_container_width=True)
+
+        st.vega_lite_chart(spec2, use_container_width=True)
         st.caption("Data: Percentage of all incidents for each building type.")
 
         # --- **FIX**: Added the missing data table ---
@@ -323,7 +453,7 @@ elif page == "Human vs. Property Risk":
     """)
 
     # --- Load Data ---
-    df_human_cost_raw = load_data(sql_human_cost)
+    chart_records = get_chart_records(get_db_version())
 
     st.divider()
 
@@ -337,35 +467,19 @@ elif page == "Human vs. Property Risk":
         🔥 **Human behaviour and routine domestic activity drive the greatest casualty risk**, not mechanical faults or deliberate acts.
         """)
     
-    # --- Filter data to Top 10 for a clean chart ---
-    df_casualty_risk = df_human_cost_raw.sort_values(by="pct_chance_of_casualty", ascending=False).head(10)
-    
-    # --- Chart 3: Altair Vertical Column Chart (Labels Fixed & Added) ---
-    base = alt.Chart(df_casualty_risk).encode(
-        x=alt.X("cause_of_fire", 
-                sort='-y', 
-                title="Cause of Fire",
-                axis=alt.Axis(labelAngle=-45)),
-        y=alt.Y("pct_chance_of_casualty", 
-                title="% of Incidents with Casualty"),
-        color=alt.value("#ff6f3c"), # Apply a specific color
-        tooltip=["cause_of_fire", "pct_chance_of_casualty", "number_of_incidents"]
+    # --- Chart 3: Vertical Column Chart (Labels Fixed & Added) ---
+    spec3 = build_bar_spec(
+        chart_records['casualty_risk'],
+        x="cause_of_fire", y="pct_chance_of_casualty",
+        x_title="Cause of Fire", y_title="% of Incidents with Casualty",
+        tooltip=["cause_of_fire", "pct_chance_of_casualty", "number_of_incidents"],
+        label_fmt=".1f",
+        sort='-y',
+        color="#ff6f3c",
+        height=350
     )
-    
-    bars = base.mark_bar()
-    
-    text = base.mark_text(
-        align='center',
-        baseline='bottom',
-        dy=-5
-    ).encode(
-        text=alt.Text("pct_chance_of_casualty", format=".1f"),
-        color=alt.value("black")
-    )
-    
-    chart3 = (bars + text).properties(height=350).interactive()
-    
-    st.altair_chart(chart3, use_container_width=True)
+
+    st.vega_lite_chart(spec3, use_container_width=True)
     st.caption("Top 10 causes of fire, ranked by chance of casualty.")
 
     st.divider()
@@ -385,66 +499,37 @@ elif page == "Human vs. Property Risk":
     with col1:
         st.markdown("**Top 5 by Fire Spread (Destruction)**")
         
-        # --- Filter data to Top 5 for a clean chart ---
-        df_spread_risk = df_human_cost_raw.sort_values(by="avg_spread_rank", ascending=False).head(5)
-        
-        # --- Chart 4: Altair Vertical Column Chart (Labels Fixed & Added) ---
-        base = alt.Chart(df_spread_risk).encode(
-            x=alt.X("cause_of_fire", 
-                    sort='-y', 
-                    title="Cause of Fire",
-                    axis=alt.Axis(labelAngle=-45)), # Angled labels
-            y=alt.Y("avg_spread_rank", 
-                    title="Average Fire Spread Rank"),
-            color=alt.value("#ff9d5c"),
-            tooltip=["cause_of_fire", "avg_spread_rank", "number_of_incidents"]
-        )
-        
-        bars = base.mark_bar()
-        
-        text = base.mark_text(
-            align='center',
-            baseline='bottom',
-            dy=-5
-        ).encode(
-            text=alt.Text("avg_spread_rank", format=".2f"),
-            color=alt.value("black")
+        # --- Chart 4: Vertical Column Chart (Labels Fixed & Added) ---
+        spec4 = build_bar_spec(
+            chart_records['spread_risk'],
+            x="cause_of_fire", y="avg_spread_rank",
+            x_title="Cause of Fire", y_title="Average Fire Spread Rank",
+            tooltip=["cause_of_fire", "avg_spread_rank", "number_of_incidents"],
+            label_fmt=".2f",
+            sort='-y',
+            color="#ff9d5c",
+            height=350
         )
-        
-        chart4 = (bars + text).properties(height=350).interactive()
-        
-        st.altair_chart(chart4, use_container_width=True)
+
+        st.vega_lite_chart(spec4, use_container_width=True)
 
     with col2:
         st.markdown("**Top 5 by Rescues (Complexity)**")
         
-        # --- Filter data to Top 5 for a clean chart ---
-        df_rescue_risk = df_human_cost_raw.sort_values(by="avg_rescues_per_incident", ascending=False).head(5)
-        
-        # --- Chart 5: Altair Vertical Column Chart (Labels Fixed & Added) ---
-        base = alt.Chart(df_rescue_risk).encode(
-            x=alt.X("cause_of_fire", 
-                    sort='-y', 
-                    title="Cause of Fire",
-                    axis=alt.Axis(labelAngle=-45)), # Angled labels
-            y=alt.Y("avg_rescues_per_incident", 
-                    title="Avg. Rescues per Incident"),
-            color=alt.value("#ffa600"),
-            tooltip=["cause_of_fire", "avg_rescues_per_incident", "number_of_incidents"]
-        )
-        
-        bars = base.mark_bar()
-        
-        text = base.mark_text(
-            align='center',
-        ).encode(
-            text=alt.Text("avg_rescues_per_incident", format=".2f"),
-            color=alt.value("black")
+        # --- Chart 5: Vertical Column Chart (Labels Fixed & Added) ---
+        spec5 = build_bar_spec(
+            chart_records['rescue_risk'],
+            x="cause_of_fire", y="avg_rescues_per_incident",
+            x_title="Cause of Fire", y_title="Avg. Rescues per Incident",
+            tooltip=["cause_of_fire", "avg_rescues_per_incident", "number_of_incidents"],
+            label_fmt=".2f",
+            sort='-y',
+            color="#ffa600",
+            height=350,
+            label_above=False
         )
 
-        chart5 = (bars + text).properties(height=350).interactive()
-        
-        st.altair_chart(chart5, use_container_width=True)
+        st.vega_lite_chart(spec5, use_container_width=True)
 
 # ---------------- PAGE 4: CONCLUSIONS ----------------
 elif page == "Conclusions":
@@ -502,7 +587,7 @@ elif page == "Methodology & ETL":
     The clean, efficient star schema I built made the complex analysis seen in this dashboard possible. 
     
     * **Backend:** SQL queries (like the one below) join the fact and dimension tables to aggregate data.
-    * **Frontend:** `Streamlit`, `Pandas`, and `Altair` are used to run these queries, perform post-query transformations (like the 'House vs. Flats' percentage pivot), and render the interactive charts.
+    * **Frontend:** `Streamlit`, `Pandas`, and `Altair` are used to run these queries, perform post-query transformations (like the 'House vs. Flats' pivot), and render the interactive charts.
     * **Hosting:** The app is deployed on Streamlit Community Cloud.
     """)
     st.code(sql_to_display, language="sql")
@@ -1,29 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import duckdb
 
 con = duckdb.connect('dwelling_fires.duckdb')
 
+# All column metadata in one query (same tables, order and types as SHOW TABLES / DESCRIBE)
+columns = con.execute("""
+    SELECT table_name, column_name, data_type
+    FROM information_schema.columns
+    WHERE table_catalog = current_database()
+      AND table_schema = current_schema()
+    ORDER BY table_name, ordinal_position
+""").fetchall()
+
+schema = {}
+for table_name, column_name, data_type in columns:
+    schema.setdefault(table_name, []).append((column_name, data_type))
+
+# Sample data (tables have different columns, so these can't be UNIONed into one query)
+def sample_table(table_name):
+    """Returns the first rows of a table as text, on its own cursor so threads don't share one."""
+    cur = con.cursor()
+    try:
+        return cur.execute(f"SELECT * FROM {table_name} LIMIT 3").df().to_string()
+    except Exception as e:
+        return f"Error getting sample: {e}"
+    finally:
+        cur.close()
+
+# The samples are independent, so fetch them concurrently and write the file in order afterwards
+with ThreadPoolExecutor(max_workers=8) as executor:
+    samples = dict(zip(schema, executor.map(sample_table, schema)))
+
 with open('schema_info.txt', 'w') as f:
     # List tables
-    tables = con.execute("SHOW TABLES").fetchall()
     f.write("TABLES:\n")
-    for t in tables:
-        f.write(f"- {t[0]}\n")
+    for table_name in schema:
+        f.write(f"- {table_name}\n")
     f.write("\n")
 
     # Describe each table
-    for t in tables:
-        table_name = t[0]
+    for table_name, table_columns in schema.items():
         f.write(f"--- SCHEMA FOR {table_name} ---\n")
-        columns = con.execute(f"DESCRIBE {table_name}").fetchall()
-        for col in columns:
-            f.write(f"{col[0]} ({col[1]})\n")
+        for column_name, data_type in table_columns:
+            f.write(f"{column_name} ({data_type})\n")
         f.write("\n")
-        
+
         # Sample data
         f.write(f"--- SAMPLE DATA FOR {table_name} ---\n")
-        try:
-            sample = con.execute(f"SELECT * FROM {table_name} LIMIT 3").df()
-            f.write(sample.to_string())
-        except Exception as e:
-            f.write(f"Error getting sample: {e}")
+        f.write(samples[table_name])
         f.write("\n\n")
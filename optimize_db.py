@@ -0,0 +1,28 @@
+import duckdb
+
+# One-off maintenance: rewrite fact_dwelling_fire ordered by its join keys so that
+# DuckDB's per-row-group min/max statistics (zone maps) can skip row groups, and with
+# the 0/1 flags and small counts narrowed so each scan reads fewer bytes.
+con = duckdb.connect('dwelling_fires.duckdb')
+
+con.execute("BEGIN TRANSACTION")
+con.execute("""
+CREATE TABLE fact_dwelling_fire_sorted AS
+SELECT * REPLACE (
+    late_call_flag::TINYINT AS late_call_flag,
+    fatality_casualty_flag::TINYINT AS fatality_casualty_flag,
+    rapid_fire_growth_flag::TINYINT AS rapid_fire_growth_flag,
+    no_alarms::SMALLINT AS no_alarms,
+    rescues::SMALLINT AS rescues,
+    evacuations::SMALLINT AS evacuations
+)
+FROM fact_dwelling_fire
+ORDER BY ignition_key, dwelling_key
+""")
+con.execute("DROP TABLE fact_dwelling_fire")
+con.execute("ALTER TABLE fact_dwelling_fire_sorted RENAME TO fact_dwelling_fire")
+con.execute("COMMIT")
+
+# Write the new table out to the database file
+con.execute("CHECKPOINT")
+con.close()